@@ -1,7 +1,10 @@
 import streamlit as st
-import re
 from io import StringIO
 
+# Tabla para pasar a mayúsculas y bytes a eliminar (todo lo que no sea ATCG)
+_MAYUSCULAS = bytes.maketrans(b'acgt', b'ACGT')
+_NO_ATCG = bytes(b for b in range(256) if b not in b'ATCGatcg')
+
 def calcular_gc(secuencia):
     """
     Calcula el porcentaje de contenido GC en una secuencia de ADN.
@@ -12,19 +15,18 @@ def calcular_gc(secuencia):
     Returns:
         float: Porcentaje de GC
     """
-    secuencia = secuencia.upper().strip()
-    # Eliminar caracteres no válidos (solo mantener ATCG)
-    secuencia = re.sub(r'[^ATCG]', '', secuencia)
+    # Eliminar caracteres no válidos (solo mantener ATCG) en una sola pasada
+    secuencia = secuencia.encode('ascii', 'ignore').translate(_MAYUSCULAS, _NO_ATCG)
     
     total = len(secuencia)
     
     if total == 0:
         return 0.0, 0, 0, 0, 0
     
-    count_g = secuencia.count('G')
-    count_c = secuencia.count('C')
-    count_a = secuencia.count('A')
-    count_t = secuencia.count('T')
+    count_g = secuencia.count(b'G')
+    count_c = secuencia.count(b'C')
+    count_a = secuencia.count(b'A')
+    count_t = secuencia.count(b'T')
     
     count_gc = count_g + count_c
     porcentaje = (count_gc / total) * 100 if total > 0 else 0.0
@@ -80,7 +82,7 @@ if modo == "Secuencia directa":
             resultados.append({
                 "ID": "Secuencia ingresada",
                 "GC": gc,
-                "Longitud": len(re.sub(r'[^ATCG]', '', secuencia.upper())),
+                "Longitud": g + c + a + t,
                 "G": g,
                 "C": c,
                 "A": a,